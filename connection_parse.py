@@ -1,56 +1,146 @@
 import csv
+import os
+import sys
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+# pyarrow parses the whole CSV with a vectorized tokenizer when available;
+# fall back to the plain csv module otherwise.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Month lookup for the fixed '%d-%b-%Y %H:%M:%S' timestamp format used in the
+# topology CSVs. Parsing the fixed-width fields directly is much faster than
+# datetime.strptime, which re-parses the format string on every call.
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(s: str) -> datetime:
+    """Parse a 'DD-Mon-YYYY HH:MM:SS' timestamp without strptime.
+
+    The CSVs reuse the same start/end times across many rows, so the
+    lru_cache avoids re-parsing repeated timestamps entirely.
+    """
+    return datetime(
+        int(s[7:11]), _MONTHS[s[3:6]], int(s[0:2]),
+        int(s[12:14]), int(s[15:17]), int(s[18:20])
+    )
+
+class Link(NamedTuple):
+    """One row of the link topology table"""
+    source: str
+    destination: str
+    start_time: datetime
+    end_time: datetime
+    link_type: str
+
+def iter_link_topology(csv_file):
+    """
+    Stream Link tuples from a Link Topology Table CSV file one at a time,
+    so consumers that only aggregate (e.g. collecting satellite IDs) never
+    hold the whole table in memory
+
+    Args:
+        csv_file (str): Path to the CSV file
+
+    Yields:
+        Link: one parsed row at a time
+    """
+    # The row shape is fixed, so csv.reader with positional unpacking avoids
+    # the per-row dict that DictReader builds
+    with open(csv_file, 'r', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        # Default keeps an empty file yielding nothing instead of PEP 479
+        # turning the StopIteration into a RuntimeError
+        next(reader, None)  # Skip the header row
+        for source, target, start, end, link_type in reader:
+            # Intern the endpoint and type strings: the same satellite names
+            # recur across thousands of rows, so this deduplicates storage and
+            # turns later dict lookups into pointer compares
+            yield Link(
+                sys.intern(source), sys.intern(target),
+                _parse_timestamp(start), _parse_timestamp(end),
+                sys.intern(link_type)
+            )
 
 def parse_link_topology(csv_file):
     """
-    Parse Link Topology Table CSV file into a dictionary structure
-    
+    Parse Link Topology Table CSV file into a list of Link tuples
+
     Args:
         csv_file (str): Path to the CSV file
-        
+
     Returns:
-        dict: Dictionary containing parsed link data
+        list: Link tuples with parsed timestamps
     """
-    links = []
-    
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Convert timestamps to datetime objects
-            start_time = datetime.strptime(row['StartTime'], '%d-%b-%Y %H:%M:%S')
-            end_time = datetime.strptime(row['EndTime'], '%d-%b-%Y %H:%M:%S')
-            
-            link = {
-                'source': row['Source'],
-                'destination': row['Target'], 
-                'start_time': start_time,
-                'end_time': end_time,
-                'link_type': row['LinkType']
-            }
-            links.append(link)
-            
-    return links
+    if pa is not None:
+        return _parse_link_topology_arrow(csv_file)
+
+    return list(iter_link_topology(csv_file))
+
+def _parse_link_topology_arrow(csv_file):
+    """Parse the topology CSV with pyarrow's vectorized reader.
+
+    StartTime/EndTime are parsed by Arrow's batched strptime kernel instead
+    of per-row Python calls; the result is converted back to the same
+    list-of-Link shape the csv path returns.
+    """
+    # Arrow raises ArrowInvalid on a zero-byte file; the csv path yields
+    # nothing, so match it rather than letting parser choice change behavior
+    if os.path.getsize(csv_file) == 0:
+        return []
+
+    table = pa_csv.read_csv(
+        csv_file,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={
+                'StartTime': pa.timestamp('s'),
+                'EndTime': pa.timestamp('s')
+            },
+            timestamp_parsers=['%d-%b-%Y %H:%M:%S']
+        )
+    )
+
+    sources = table.column('Source').to_pylist()
+    targets = table.column('Target').to_pylist()
+    starts = table.column('StartTime').to_pylist()
+    ends = table.column('EndTime').to_pylist()
+    link_types = table.column('LinkType').to_pylist()
+
+    # Intern the endpoint and type strings just like the csv path, so the
+    # pointer-compare lookups downstream don't depend on which parser ran
+    return [
+        Link(sys.intern(src), sys.intern(tgt), start, end, sys.intern(lt))
+        for src, tgt, start, end, lt in zip(sources, targets, starts, ends, link_types)
+    ]
 
 def main():
-    # Example usage
+    # Example usage -- stream the rows instead of materializing the table
     csv_file = 'Link Topology Table.csv'
-    topology = parse_link_topology(csv_file)
-    
+    topology = iter_link_topology(csv_file)
+
     # Print first few entries as example
     # for link in topology:
-    #     print(f"Source: {link['source']}")
-    #     print(f"Destination: {link['destination']}")
-    #     print(f"Start Time: {link['start_time']}")
-    #     print(f"End Time: {link['end_time']}")
-    #     print(f"Link Type: {link['link_type']}")
+    #     print(f"Source: {link.source}")
+    #     print(f"Destination: {link.destination}")
+    #     print(f"Start Time: {link.start_time}")
+    #     print(f"End Time: {link.end_time}")
+    #     print(f"Link Type: {link.link_type}")
     #     print("---")
 
-    ## from the dict, we need to figure out how many satellites are there, and link type is LEO_LEO
+    ## from the links, we need to figure out how many satellites are there, and link type is LEO_LEO
     satellites = set()
     for link in topology:
-        if link['link_type'] == 'LEO_LEO':
-            satellites.add(link['source'].split(' ')[0])
-            satellites.add(link['destination'].split(' ')[0])
+        if link.link_type == 'LEO_LEO':
+            satellites.add(link.source.split(' ')[0])
+            satellites.add(link.destination.split(' ')[0])
     print(f"Number of Satellites: {len(satellites)}")
     print(satellites)
 
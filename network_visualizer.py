@@ -1,8 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
-import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from typing import Dict, Optional
 import random
@@ -28,8 +28,6 @@ class NetworkVisualizer:
         self.status_bar = ttk.Label(self.root, text="Ready", relief=tk.SUNKEN)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Initialize network graph
-        self.graph = nx.Graph()
         self.figure = Figure(figsize=(8, 6))
         self.ax = self.figure.add_subplot(111)
         
@@ -43,6 +41,13 @@ class NetworkVisualizer:
         # Network data
         self.network = None
         self.selected_satellite = None
+        self._pos_cache = {}  # sat_id -> (x, y), computed once per network
+
+        # Blitting state: nodes/labels are rendered once into a cached
+        # background, and refreshes only redraw the edge collection
+        self._edge_lc = None
+        self._background = None
+        self._static_ids = None  # Satellite IDs baked into the background
         
     def init_control_panel(self):
         """Initialize control panel widgets"""
@@ -71,6 +76,12 @@ class NetworkVisualizer:
     def set_network(self, network):
         """Set the network to visualize"""
         self.network = network
+        # Orbit positions only depend on the satellite ID, so compute them
+        # once here instead of re-parsing IDs on every redraw
+        self._pos_cache = {
+            sat_id: self.get_orbit_position(sat_id)
+            for sat_id in network.satellites
+        }
         self.update_satellite_list()
         self.update_visualization()
         
@@ -113,76 +124,80 @@ class NetworkVisualizer:
             # Fallback to random position if ID format is unexpected
             return (random.uniform(-1, 1), random.uniform(-1, 1))
 
-    def update_visualization(self):
-        """Update network visualization"""
-        if not self.network:
-            return
-            
-        self.graph.clear()
+    def _draw_static_background(self):
+        """Render nodes, labels and axes once and cache them for blitting"""
+        positions = self._pos_cache
         self.ax.clear()
-        
-        # Add nodes (satellites)
-        positions = {}
-        for sat_id, satellite in self.network.satellites.items():
-            self.graph.add_node(sat_id)
-            # Use orbital position instead of geographic coordinates
-            positions[sat_id] = self.get_orbit_position(sat_id)
-            
-        # Add edges (connections)
-        edges = []
-        edge_colors = []
-        edge_widths = []
-        
-        for sat_id, satellite in self.network.satellites.items():
-            for neighbor_id, neighbor_info in satellite.neighbors.items():
-                edges.append((sat_id, neighbor_id))
-                # Color based on link quality
-                link_quality = neighbor_info['link_quality']
-                edge_colors.append('g' if link_quality > 0.7 else 'y')
-                edge_widths.append(link_quality * 2)
-        
-        # Draw network
         self.ax.set_title("Satellite Network Topology")
-        
-        # Draw nodes (satellites)
-        nx.draw_networkx_nodes(
-            self.graph,
-            positions,
-            node_color='lightblue',
-            node_size=500,
-            ax=self.ax
-        )
-        
-        # Draw edges (connections)
-        nx.draw_networkx_edges(
-            self.graph,
-            positions,
-            edgelist=edges,
-            edge_color=edge_colors,
-            width=edge_widths,
-            ax=self.ax
-        )
-        
+
+        # Draw nodes (satellites) in one scatter call
+        node_xs = [positions[sat_id][0] for sat_id in self.network.satellites]
+        node_ys = [positions[sat_id][1] for sat_id in self.network.satellites]
+        self.ax.scatter(node_xs, node_ys, s=500, c='lightblue', zorder=2)
+
         # Draw labels
-        nx.draw_networkx_labels(
-            self.graph,
-            positions,
-            font_size=8,
-            ax=self.ax
-        )
-        
+        for sat_id in self.network.satellites:
+            x, y = positions[sat_id]
+            self.ax.text(x, y, sat_id, fontsize=8, zorder=3,
+                         horizontalalignment='center', verticalalignment='center')
+
         # Add orbit labels
         for orbit in range(3):  # Assuming 3 orbits
             self.ax.text(
-                orbit/2 - 0.5, 
-                -0.7, 
+                orbit/2 - 0.5,
+                -0.7,
                 f'Orbit {orbit+1}',
                 horizontalalignment='center'
             )
-        
+
         self.ax.set_xlim(-1, 1)
         self.ax.set_ylim(-1, 1)
+
+        # The edge collection is the only animated artist; it is excluded
+        # from the cached background and redrawn on every refresh
+        self._edge_lc = LineCollection([], animated=True, zorder=1)
+        self.ax.add_collection(self._edge_lc)
+
         self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._static_ids = set(self.network.satellites)
+
+    def update_visualization(self):
+        """Update network visualization"""
+        if not self.network:
+            return
+
+        # Cached orbital positions; satellites added after set_network fall
+        # back to computing their position on first sight
+        positions = self._pos_cache
+        for sat_id in self.network.satellites:
+            if sat_id not in positions:
+                positions[sat_id] = self.get_orbit_position(sat_id)
+
+        # Re-render the static layer only when the node set changed
+        if self._background is None or self._static_ids != set(self.network.satellites):
+            self._draw_static_background()
+
+        # Build edge segments (connections) as one batch
+        segments = []
+        edge_colors = []
+        edge_widths = []
+
+        for sat_id, satellite in self.network.satellites.items():
+            for neighbor_id, neighbor_info in satellite.neighbors.items():
+                segments.append((positions[sat_id], positions[neighbor_id]))
+                # Color based on link quality
+                link_quality = neighbor_info['link_quality']
+                edge_colors.append('g' if link_quality > 0.7 else 'y')
+                edge_widths.append(link_quality * 2)
+
+        # Blit: restore the cached background and redraw just the edges
+        self._edge_lc.set_segments(segments)
+        self._edge_lc.set_color(edge_colors)
+        self._edge_lc.set_linewidths(edge_widths)
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self._edge_lc)
+        self.canvas.blit(self.ax.bbox)
         
     def update_satellite_info(self, satellite_id: str):
         """Update satellite information display"""
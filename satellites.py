@@ -1,8 +1,11 @@
 from threading import Thread, Lock
-from queue import Queue
+from queue import Queue, Empty
+from array import array
 from dataclasses import dataclass
 from typing import Dict, Set, Optional, List, Any
 from datetime import datetime, timedelta
+import heapq
+import sys
 import time
 import logging
 import random
@@ -10,8 +13,47 @@ import random
 
 ## NOTE: Some of the data feilds are for temporary reasons, they are not used, or might be removed.
 
-# Global satellite registry to store all satellites, and identify them uniquely
+# Private RNG for link parameters and jitter: keeps simulation draws off the
+# random module's shared global instance (and its hidden module-level state),
+# and gives one obvious place to seed for reproducible runs
+_rng = random.Random()
+
+# Global satellite registry to store all satellites, and identify them
+# uniquely. Mutated copy-on-write under _registry_lock like the per-satellite
+# tables: lookups read whatever snapshot is currently bound, with no lock and
+# no reliance on in-place dict mutation being safe to iterate concurrently.
 _satellite_registry: Dict[str, 'SatelliteThread'] = {}
+_registry_lock = Lock()
+
+def to_epoch_ns(dt: datetime) -> int:
+    """Pack a datetime into int64 epoch nanoseconds for hot-path compares"""
+    return int(dt.timestamp() * 1_000_000_000)
+
+def _drain_queue(q: Queue) -> list:
+    """Drain all queued items in one shot, preserving FIFO order.
+
+    Swapping the underlying deque under the queue's own mutex costs one
+    lock acquisition per drain instead of one get() (mutex + condition
+    signal) per item, which matters during routing-message bursts.
+    """
+    # Peeking at the deque without the mutex is a benign race: reading its
+    # truthiness is atomic under the GIL, and an item that lands just after
+    # the peek is picked up on the next drain -- exactly as if it had
+    # arrived after the drain. Idle queues therefore cost no lock at all.
+    if not q.queue:
+        return []
+    with q.mutex:
+        if not q.queue:
+            return []
+        items = list(q.queue)
+        q.queue.clear()
+        q.unfinished_tasks = 0
+        q.not_full.notify_all()
+        # Wake join() callers: a drained item is applied within the same
+        # tick, so "taken off the queue" is the join semantics producers
+        # get (used by the test harness to sync topology install)
+        q.all_tasks_done.notify_all()
+    return items
 
 def get_satellite_by_id(satellite_id: str) -> Optional['SatelliteThread']:
     """Get a satellite instance by its ID"""
@@ -19,13 +61,22 @@ def get_satellite_by_id(satellite_id: str) -> Optional['SatelliteThread']:
 
 def register_satellite(satellite: 'SatelliteThread'):
     """Register a satellite in the global registry"""
-    _satellite_registry[satellite.id] = satellite
+    global _satellite_registry
+    with _registry_lock:
+        updated = dict(_satellite_registry)
+        updated[satellite.id] = satellite
+        _satellite_registry = updated
 
 def unregister_satellite(satellite_id: str):
     """Remove a satellite from the global registry"""
-    _satellite_registry.pop(satellite_id, None)
+    global _satellite_registry
+    with _registry_lock:
+        if satellite_id in _satellite_registry:
+            updated = dict(_satellite_registry)
+            del updated[satellite_id]
+            _satellite_registry = updated
 
-@dataclass
+@dataclass(slots=True)
 class SatelliteMetadata:
     """Metadata class to store satellite capabilities and parameters"""
     # Basic Capabilities
@@ -51,15 +102,35 @@ class SatelliteMetadata:
     total_packets_received: int = 0
     successful_transmission_rate: float = 1.0  # Percentage (0-1)
 
-@dataclass
+# Frozen: a broadcast shares one message instance across every receiver's
+# queue, which is only safe because receivers cannot mutate it
+@dataclass(slots=True, frozen=True)
 class RoutingMessage:
     """Message structure for routing updates"""
     sender_id: str
     sequence_num: int
-    routes: Dict[str, Dict]  # destination -> {'hops': count, 'cost': value}
+    routes: Dict[str, tuple]  # destination -> (hops, cost)
     timestamp: datetime
+    # Delta updates carry only destinations changed since the sender's last
+    # broadcast; receivers keep existing state for unlisted destinations
+    is_delta: bool = False
+    # Hash of the routes payload; lets receivers skip the whole table pass
+    # when a sender re-announces exactly what it sent last time
+    routes_hash: Optional[int] = None
+
+@dataclass(slots=True)
+class Route:
+    """One routing-table entry.
 
-@dataclass
+    Slots instead of a per-route dict: field access is a C array load and
+    a 10k-route table no longer carries 10k dict headers.
+    """
+    next_hop: str
+    hops: int
+    cost: float
+    timestamp: int  # epoch nanoseconds
+
+@dataclass(slots=True)
 class NeighborInfo:
     """Information about a neighboring satellite"""
     link_quality: float
@@ -69,29 +140,92 @@ class NeighborInfo:
     signal_strength: float
     bandwidth_available: float
     active: bool = True
+    # Link window and last_seen as epoch seconds, so the hot-path checks
+    # compare plain floats instead of datetime objects
+    start_ts: float = 0.0
+    end_ts: float = 0.0
+    last_seen_ts: float = 0.0
+    # 1/link_quality, cached so the routing loop never divides
+    inv_quality: float = 1.0
+    # Full link cost, recomputed only when link parameters change so
+    # get_link_cost is a single attribute load on the routing hot path
+    cached_cost: float = 1.0
+
+    def __post_init__(self):
+        self.start_ts = self.start_time.timestamp()
+        self.end_ts = self.end_time.timestamp()
+        self.last_seen_ts = self.last_seen.timestamp()
+        self.recompute_cost()
+
+    def recompute_cost(self):
+        """Refresh the derived cost fields after a link-parameter change"""
+        self.inv_quality = 1.0 / self.link_quality
+        # Currently pure link quality; the composite signal/bandwidth
+        # weighting sketched in get_link_cost would slot in here so the
+        # divisions stay amortized to once per update
+        self.cached_cost = self.inv_quality
+
+def create_satellites(satellite_ids: List[str], k_hops: int = 10, clock=None) -> List['SatelliteThread']:
+    """Create many satellites with metadata sampled in one batch.
+
+    Draws every random field for the whole constellation up front instead of
+    interleaving per-field draws inside each __init__. The batch layout
+    mirrors numpy's Generator.uniform(low, high, size=N), so the sampling can
+    be swapped for vectorized draws without touching the callers.
+    """
+    n = len(satellite_ids)
+    comp = [_rng.uniform(1000, 2000) for _ in range(n)]
+    bw = [_rng.uniform(100, 1000) for _ in range(n)]
+    proc = [_rng.uniform(1.0, 4.0) for _ in range(n)]
+    comm = [_rng.uniform(1000, 2000) for _ in range(n)]
+    lat = [_rng.uniform(-90, 90) for _ in range(n)]
+    lon = [_rng.uniform(-180, 180) for _ in range(n)]
+    alt = [_rng.uniform(500, 1000) for _ in range(n)]
+
+    return [
+        SatelliteThread(
+            sat_id, k_hops=k_hops, clock=clock,
+            metadata=SatelliteMetadata(
+                computational_capacity=comp[i],
+                bandwidth_capacity=bw[i],
+                processing_power=proc[i],
+                communication_range=comm[i]
+            ),
+            coordinates={'latitude': lat[i], 'longitude': lon[i], 'altitude': alt[i]}
+        )
+        for i, sat_id in enumerate(satellite_ids)
+    ]
 
 class SatelliteThread(Thread):
-    def __init__(self, satellite_id: str, k_hops: int = 10, clock=None):
+    def __init__(self, satellite_id: str, k_hops: int = 10, clock=None,
+                 metadata: Optional[SatelliteMetadata] = None,
+                 coordinates: Optional[Dict[str, float]] = None):
         super().__init__()
-        self.id = satellite_id
+        # Interned so every table keyed by satellite ID shares one string
+        # object and hashes/compares by pointer
+        self.id = sys.intern(satellite_id)
         register_satellite(self)
         self.k_hops = k_hops
         self.daemon = True
-        self.clock = clock or datetime.now  # Use simulation clock if provided, else real time
-        
-        # Initialize metadata with random values (for simulation)
-        self._metadata = SatelliteMetadata(
-            computational_capacity=random.uniform(1000, 2000),
-            bandwidth_capacity=random.uniform(100, 1000),
-            processing_power=random.uniform(1.0, 4.0),
-            communication_range=random.uniform(1000, 2000)
+        # Use simulation clock if provided, else real time. The fallback is
+        # the datetime class itself: datetime.now() matches the clock's
+        # .now() interface, whereas datetime.now would not.
+        self.clock = clock or datetime
+
+        # Initialize metadata with random values (for simulation) unless the
+        # caller supplies batch-sampled values
+        self._metadata = metadata or SatelliteMetadata(
+            computational_capacity=_rng.uniform(1000, 2000),
+            bandwidth_capacity=_rng.uniform(100, 1000),
+            processing_power=_rng.uniform(1.0, 4.0),
+            communication_range=_rng.uniform(1000, 2000)
         )
-        
+
         # Geographic coordinates
-        self._coordinates = {
-            'latitude': random.uniform(-90, 90),
-            'longitude': random.uniform(-180, 180),
-            'altitude': random.uniform(500, 1000)
+        self._coordinates = coordinates or {
+            'latitude': _rng.uniform(-90, 90),
+            'longitude': _rng.uniform(-180, 180),
+            'altitude': _rng.uniform(500, 1000)
         }
         
         # Communication queues
@@ -99,24 +233,84 @@ class SatelliteThread(Thread):
         self.ground_queue = Queue()
         self.neighbor_update_queue = Queue()  # For neighbor updates
         
-        # Routing information
-        self.routing_table: Dict[str, Dict] = {}  # dest -> {next_hop, hops, cost, timestamp}
+        # Routing information. The table is copy-on-write: writers build a
+        # new dict under _write_lock and rebind the attribute, so readers
+        # take a consistent snapshot by just reading self.routing_table.
+        self.routing_table: Dict[str, Route] = {}  # dest -> Route
         self.sequence_num = 0
-        self.seen_messages: Set[tuple] = set()
+        # Highest sequence number seen per sender. Sequence numbers only move
+        # forward, so one int per sender both dedups and drops stale
+        # retransmissions -- bounded by the neighbor count instead of growing
+        # with message volume
+        self._last_seen_seq: Dict[str, int] = {}
+        # Destinations whose route changed since the last broadcast; steady
+        # state sends nothing, churn sends only the changed entries, and a
+        # periodic full sync covers receivers that missed deltas
+        self._dirty_routes: set = set()
+        self._full_sync_interval = 30  # seconds
+        self._last_full_sync = 0.0
+        # routes_hash of the last payload processed per sender, for the
+        # identical-payload short circuit
+        self._last_routes_hash: Dict[str, int] = {}
+        # Full-sync payload cached per table snapshot: every route change
+        # swaps in a new table dict, so while the identity matches, the
+        # advertised routes (and their hash) cannot have changed
+        self._full_payload: Optional[Dict[str, tuple]] = None
+        self._full_payload_table: Optional[Dict[str, Route]] = None
+        self._full_payload_hash: int = 0
         
-        # Locks
-        self.routing_lock = Lock()
-        self.neighbor_lock = Lock()
-        self.metadata_lock = Lock()
+        # Single writer lock. Readers of neighbors/routing_table never lock:
+        # both dicts are swapped copy-on-write (attribute rebinds are atomic
+        # under the GIL), so _write_lock only serializes writers against each
+        # other. Metadata mutations are rare enough to share it too, which
+        # also rules out lock-ordering issues between separate locks.
+        self._write_lock = Lock()
         
         # Neighbor management
         self.neighbors: Dict[str, NeighborInfo] = {}
+        # Parallel columns over the neighbors, kept in sync under
+        # _write_lock. The active-window scan walks these compact arrays
+        # instead of touching one NeighborInfo object per neighbor.
+        self._neighbor_ids: List[str] = []
+        self._neighbor_start = array('d')
+        self._neighbor_end = array('d')
+        self._neighbor_quality = array('d')
+        self._neighbor_active = array('b')
+        self._nid_to_idx: Dict[str, int] = {}
+        # Min-heap of (end_ts, neighbor_id) so expiry checks pop only the
+        # links whose window actually ended instead of scanning everyone
+        self._expiry_heap: List[tuple] = []
+        # Cached active-neighbor view, rebuilt only when a mutation marks it
+        # dirty or the clock crosses a link-window boundary
+        self._neighbor_view_dirty = True
+        self._active_view: List[str] = []
+        # incoming_queue references of the active view, rebuilt with it so
+        # broadcasts skip the registry lookup per neighbor per send
+        self._active_queues: List[Queue] = []
+        self._active_view_from = 0.0
+        self._active_view_until = 0.0
+        # Tick deadlines are kept as epoch-second floats: the periodic checks
+        # run every tick for every satellite, and a float compare beats a
+        # datetime subtraction plus timedelta allocation
+        now_ts = self.clock.now().timestamp()
         self.neighbor_check_interval = 10  # seconds
-        self.last_neighbor_check = datetime.now()
-        
+        self.last_neighbor_check = now_ts
+        # A link counts as dead only after missing several full-sync
+        # heartbeats; a timeout shorter than the heartbeat would flap every
+        # healthy-but-quiet neighbor
+        self.neighbor_timeout = self._full_sync_interval * 3  # seconds
+
         # Update intervals
         self.routing_update_interval = 1  # seconds
-        self.last_routing_update = datetime.now()
+        self.last_routing_update = now_ts
+        self._last_maintenance = now_ts
+        # Debounce deadline for triggered routing updates: route changes set
+        # this once and run() emits a single coalesced broadcast when the
+        # deadline passes, instead of sleeping per message
+        self._pending_since: Optional[float] = None
+        # Set by neighbor adds; tick() turns any number of adds in one drain
+        # into at most one full broadcast
+        self._needs_full_broadcast = False
         
         # Performance tracking
         self.stats = {
@@ -128,365 +322,755 @@ class SatelliteThread(Thread):
     @property
     def metadata(self) -> SatelliteMetadata:
         """Get satellite metadata"""
-        with self.metadata_lock:
+        with self._write_lock:
             return self._metadata
-    
+
     def update_metadata(self, **kwargs):
         """Update satellite metadata parameters"""
-        with self.metadata_lock:
+        with self._write_lock:
             for key, value in kwargs.items():
                 if hasattr(self._metadata, key):
                     setattr(self._metadata, key, value)
                 else:
                     raise ValueError(f"Invalid metadata parameter: {key}")
     
-    def add_neighbor(self, neighbor_id: str, start_time: datetime, 
-                    end_time: datetime, link_quality: float = 1):
+    def add_neighbor(self, neighbor_id: str, start_time: datetime,
+                    end_time: datetime, link_quality: float = 1,
+                    now: Optional[datetime] = None):
         """Add or update a neighboring satellite"""
-        with self.neighbor_lock:
-            self.neighbors[neighbor_id] = NeighborInfo(
+        neighbor_id = sys.intern(neighbor_id)
+        if now is None:
+            now = self.clock.now()
+
+        with self._write_lock:
+            info = NeighborInfo(
                 link_quality=link_quality,
                 start_time=start_time,
                 end_time=end_time,
-                last_seen=self.clock.now(),  # Use simulation clock
-                signal_strength=random.uniform(-85, -70),
-                bandwidth_available=random.uniform(50, 100)
+                last_seen=now,  # Use simulation clock
+                signal_strength=_rng.uniform(-85, -70),
+                bandwidth_available=_rng.uniform(50, 100)
             )
-            logging.info(f"{self.id}: Added neighbor {neighbor_id}")
-            
-            # Add direct route to the neighbor
-            with self.routing_lock:
-                self.routing_table[neighbor_id] = {
-                    'next_hop': neighbor_id,
-                    'hops': 1,
-                    'cost': 1.0 / link_quality,
-                    'timestamp': self.clock.now()
-                }
-            
-            # Trigger routing update
-            self.send_routing_update()
+            new_neighbors = dict(self.neighbors)
+            new_neighbors[neighbor_id] = info
+            self.neighbors = new_neighbors  # Atomic snapshot swap
+
+            idx = self._nid_to_idx.get(neighbor_id)
+            if idx is None:
+                self._nid_to_idx[neighbor_id] = len(self._neighbor_ids)
+                self._neighbor_ids.append(neighbor_id)
+                self._neighbor_start.append(info.start_ts)
+                self._neighbor_end.append(info.end_ts)
+                self._neighbor_quality.append(link_quality)
+                self._neighbor_active.append(1)
+            else:
+                self._neighbor_start[idx] = info.start_ts
+                self._neighbor_end[idx] = info.end_ts
+                self._neighbor_quality[idx] = link_quality
+                self._neighbor_active[idx] = 1
+            heapq.heappush(self._expiry_heap, (info.end_ts, neighbor_id))
+            self._neighbor_view_dirty = True
+            logging.info("%s: Added neighbor %s", self.id, neighbor_id)
+
+            # Add the direct route only once the link window is open: a
+            # link scheduled for later is not a usable hop yet, and
+            # installing it early advertises a phantom route. When the
+            # window opens, the first message heard over the link installs
+            # the direct route in process_routing_message.
+            now_ts = now.timestamp()
+            if info.start_ts <= now_ts <= info.end_ts:
+                new_routes = dict(self.routing_table)
+                new_routes[neighbor_id] = Route(
+                    next_hop=neighbor_id,
+                    hops=1,
+                    cost=info.cached_cost,
+                    timestamp=to_epoch_ns(now)
+                )
+                self.routing_table = new_routes
+                self._dirty_routes.add(neighbor_id)
+                # Flag rather than send: a new neighbor needs our whole
+                # table, but a burst of adds in one drain should cost one
+                # broadcast, so tick() consumes the flag once per cycle
+                self._needs_full_broadcast = True
     
     def remove_neighbor(self, neighbor_id: str):
         """Remove a neighboring satellite"""
-        with self.neighbor_lock:
+        with self._write_lock:
             if neighbor_id in self.neighbors:
-                del self.neighbors[neighbor_id]
+                new_neighbors = dict(self.neighbors)
+                del new_neighbors[neighbor_id]
+                self.neighbors = new_neighbors
+                self._drop_neighbor_columns(neighbor_id)
+                self._neighbor_view_dirty = True
+                # Forget the sender's last payload hash: we just purged the
+                # routes it vouched for, so an identical re-announcement
+                # after the link re-forms must take the full table pass, not
+                # the unchanged-payload short circuit
+                self._last_routes_hash.pop(neighbor_id, None)
                 # Clean up routing entries through this neighbor
-                self.cleanup_routes(neighbor_id)
-                logging.info(f"Satellite {self.id} removed neighbor {neighbor_id}")
+                self._cleanup_routes_locked(neighbor_id)
+                logging.info("Satellite %s removed neighbor %s", self.id, neighbor_id)
+
+    def _drop_neighbor_columns(self, neighbor_id: str):
+        """Swap-remove a neighbor's row from the parallel columns.
+
+        Caller must hold _write_lock.
+        """
+        idx = self._nid_to_idx.pop(neighbor_id, None)
+        if idx is None:
+            return
+        last = len(self._neighbor_ids) - 1
+        if idx != last:
+            moved_id = self._neighbor_ids[last]
+            self._neighbor_ids[idx] = moved_id
+            self._neighbor_start[idx] = self._neighbor_start[last]
+            self._neighbor_end[idx] = self._neighbor_end[last]
+            self._neighbor_quality[idx] = self._neighbor_quality[last]
+            self._neighbor_active[idx] = self._neighbor_active[last]
+            self._nid_to_idx[moved_id] = idx
+        self._neighbor_ids.pop()
+        self._neighbor_start.pop()
+        self._neighbor_end.pop()
+        self._neighbor_quality.pop()
+        self._neighbor_active.pop()
     
     def cleanup_routes(self, neighbor_id: str):
         """Clean up routing table entries going through a removed neighbor"""
+        with self._write_lock:
+            self._cleanup_routes_locked(neighbor_id)
+
+    def _cleanup_routes_locked(self, neighbor_id: str):
+        """Swap in a routing table without routes via the removed neighbor.
+
+        Caller must hold _write_lock.
+        """
         ## TODO Edge cases remain still, some of the destinations might still be reachable
-        with self.routing_lock:
-            routes_to_remove = []
-            for dest, route_info in self.routing_table.items():
-                if route_info['next_hop'] == neighbor_id:
-                    routes_to_remove.append(dest)
-            
-            for dest in routes_to_remove:
-                del self.routing_table[dest]
+        self.routing_table = {
+            dest: route_info
+            for dest, route_info in self.routing_table.items()
+            if route_info.next_hop != neighbor_id
+        }
     
-    def check_neighbor_status(self):
-        """Check and update neighbor status"""
-        current_time = datetime.now()
-        with self.neighbor_lock:
-            neighbors_to_remove = []
-            for neighbor_id, info in self.neighbors.items():
-                # Check if link is expired
-                if current_time > info.end_time:
-                    neighbors_to_remove.append(neighbor_id)
+    def get_active_neighbors(self, current_time: datetime) -> List[str]:
+        """IDs of neighbors whose link window covers current_time.
+
+        The filtered list is cached and reused until a neighbor mutation
+        marks the view dirty or the clock crosses the nearest link-window
+        boundary, so back-to-back broadcasts in the same tick don't rescan.
+        Callers must not mutate the returned list.
+        """
+        t = current_time.timestamp()
+        with self._write_lock:
+            if (not self._neighbor_view_dirty
+                    and self._active_view_from <= t < self._active_view_until):
+                return self._active_view
+
+            ids = self._neighbor_ids
+            active = self._neighbor_active
+            starts = self._neighbor_start
+            ends = self._neighbor_end
+
+            view = []
+            valid_until = float('inf')
+            for i in range(len(ids)):
+                if not active[i]:
                     continue
-                
-                # Check if neighbor is still active
-                if (current_time - info.last_seen).seconds > self.neighbor_check_interval * 2:
+                if starts[i] <= t <= ends[i]:
+                    view.append(ids[i])
+                    valid_until = min(valid_until, ends[i])
+                elif starts[i] > t:
+                    # Future link: the view changes once it opens
+                    valid_until = min(valid_until, starts[i])
+
+            self._active_view = view
+            # Resolve registry references once per rebuild, so broadcast is
+            # a tight loop over queue objects with no per-send dict lookup
+            self._active_queues = [
+                sat.incoming_queue for nid in view
+                if (sat := get_satellite_by_id(nid)) is not None
+            ]
+            self._active_view_from = t
+            self._active_view_until = valid_until
+            self._neighbor_view_dirty = False
+            return view
+
+    def check_neighbor_status(self, now: Optional[datetime] = None):
+        """Check and update neighbor status.
+
+        Delegates to _periodic_maintenance, which tick() runs on its own
+        schedule; kept so external callers can force a sweep without
+        duplicating the expiry/inactivity logic (and its thresholds).
+        """
+        current_time = now if now is not None else self.clock.now()
+        self._periodic_maintenance(current_time)
+
+    def _periodic_maintenance(self, current_time: datetime):
+        """Fused maintenance pass: expired links, dead neighbors, stale routes.
+
+        One walk over neighbors and one over the routing table under a single
+        _write_lock acquisition, instead of three separate timer loops each
+        re-pulling the dicts into cache.
+        """
+        t = current_time.timestamp()
+        current_ns = to_epoch_ns(current_time)
+        # Stale means unconfirmed across several full syncs; deltas don't
+        # refresh unchanged routes, so the periodic sync is the heartbeat
+        max_age_ns = self._full_sync_interval * 3 * 1_000_000_000
+
+        neighbors_to_remove = []
+        with self._write_lock:
+            # Pop expired links off the heap; entries can be stale when a
+            # link was re-added with a later end time, so revalidate
+            while self._expiry_heap and self._expiry_heap[0][0] < t:
+                _, neighbor_id = heapq.heappop(self._expiry_heap)
+                info = self.neighbors.get(neighbor_id)
+                if info is not None and info.end_ts < t:
+                    neighbors_to_remove.append(neighbor_id)
+
+            for neighbor_id, info in self.neighbors.items():
+                if info.active and t - info.last_seen_ts > self.neighbor_timeout:
                     info.active = False
-                    logging.warning(f"Neighbor {neighbor_id} appears to be inactive")
-            
-            # Remove expired neighbors
-            for neighbor_id in neighbors_to_remove:
-                self.remove_neighbor(neighbor_id)
-    
+                    self._neighbor_active[self._nid_to_idx[neighbor_id]] = 0
+                    self._neighbor_view_dirty = True
+                    logging.warning("Neighbor %s appears to be inactive", neighbor_id)
+
+            table = self.routing_table
+            kept = {
+                dest: route for dest, route in table.items()
+                if current_ns - route.timestamp <= max_age_ns
+            }
+            removed_routes = []
+            if len(kept) != len(table):
+                removed_routes = [dest for dest in table if dest not in kept]
+                self.routing_table = kept
+
+        # Mutations that re-acquire _write_lock happen after release
+        for neighbor_id in neighbors_to_remove:
+            self.remove_neighbor(neighbor_id)
+        for dest in removed_routes:
+            logging.info("%s: Removed stale route to %s", self.id, dest)
+
+    def tick(self, current_time: Optional[datetime] = None):
+        """Run one iteration of the satellite's protocol loop.
+
+        Callable either from the satellite's own thread (run) or from a
+        single-threaded SatelliteScheduler driving many satellites.
+        """
+        if current_time is None:
+            current_time = self.clock.now()
+        now_ts = current_time.timestamp()
+
+        # Process queues
+        self.process_neighbor_updates(current_time)
+        self.process_incoming_messages(current_time)
+
+        # One full broadcast covers any number of neighbor adds this cycle
+        if self._needs_full_broadcast:
+            self._needs_full_broadcast = False
+            self.send_routing_update(current_time, full=True)
+            self.last_routing_update = now_ts
+
+        # Emit one coalesced update for all route changes since the
+        # debounce deadline was set
+        if self._pending_since is not None and now_ts >= self._pending_since:
+            self._pending_since = None
+            self.send_routing_update(current_time)
+            self.last_routing_update = now_ts
+
+        # Periodic routing update
+        if now_ts - self.last_routing_update >= self.routing_update_interval:
+            self.send_routing_update(current_time)
+            self.last_routing_update = now_ts
+
+        # Fused periodic maintenance (neighbor expiry + stale routes)
+        if now_ts - self._last_maintenance >= self.neighbor_check_interval:
+            self._periodic_maintenance(current_time)
+            self._last_maintenance = now_ts
+
+    def next_deadline(self, now_ts: float) -> float:
+        """Earliest epoch-second time this satellite needs another tick.
+
+        Lets a central scheduler sleep exactly until someone has work,
+        instead of polling every satellite every 100 ms.
+        """
+        deadline = self.last_routing_update + self.routing_update_interval
+        if self._pending_since is not None and self._pending_since < deadline:
+            deadline = self._pending_since
+        maintenance_at = self._last_maintenance + self.neighbor_check_interval
+        if maintenance_at < deadline:
+            deadline = maintenance_at
+        # Queued messages or a flagged broadcast need servicing now
+        if (self._needs_full_broadcast
+                or not self.incoming_queue.empty()
+                or not self.neighbor_update_queue.empty()):
+            return now_ts
+        return deadline
+
     def run(self):
-        """Main thread loop"""
+        """Main thread loop (thread-per-satellite mode)"""
         logging.info(f"Satellite {self.id} started")
-        last_cleanup = self.clock.now()
-        
+
+        wake = 0.1
         while True:
-            current_time = self.clock.now()
-            
-            # Process queues
-            self.process_neighbor_updates()
-            self.process_incoming_messages()
-            
-            # Periodic routing update
-            if (current_time - self.last_routing_update) >= timedelta(seconds=self.routing_update_interval):
-                self.send_routing_update()
-                self.last_routing_update = current_time
-            
-            # Periodic cleanup
-            if (current_time - last_cleanup) >= timedelta(seconds=30):
-                self.cleanup_old_routes()
-                last_cleanup = current_time
-            
-            time.sleep(0.1)  # Prevent busy waiting
+            # Block on the message queue instead of sleeping a fixed 100 ms:
+            # a quiet satellite wakes only for periodic work, and an arriving
+            # message is handled immediately instead of on the next poll.
+            # tick() drains whatever else queued up behind the first item.
+            try:
+                first = self.incoming_queue.get(timeout=wake)
+            except Empty:
+                first = None
+
+            # Read the clock once per tick and pass it down, instead of every
+            # method re-querying it per message/route
+            now = self.clock.now()
+            if isinstance(first, RoutingMessage):
+                # Apply pending neighbor adds first: the message may be the
+                # new neighbor's opening full-table announcement, which would
+                # be dropped as coming from a stranger otherwise
+                self.process_neighbor_updates(now)
+                self.process_routing_message(first, now)
+                self.stats['messages_processed'] += 1
+            self.tick(now)
+
+            # Sleep until the next scheduled deadline, capped at the old
+            # 100 ms cadence so events arriving on the other queues are
+            # still picked up promptly even when nothing is due sooner
+            now_ts = now.timestamp()
+            wake = min(0.1, max(0.0, self.next_deadline(now_ts) - now_ts))
     
-    def process_neighbor_updates(self):
+    def process_neighbor_updates(self, now: Optional[datetime] = None):
         """Process updates in the neighbor update queue"""
-        while not self.neighbor_update_queue.empty():
-            update = self.neighbor_update_queue.get()
-            update_type = update.get('type', '')
-            
-            if update_type == 'ADD':
-                self.add_neighbor(
-                    neighbor_id=update['neighbor_id'],
-                    start_time=update['start_time'],
-                    end_time=update['end_time'],
-                    link_quality=update.get('link_quality', 1)
-                )
-                self.send_routing_update()
-                
-            elif update_type == 'REMOVE':
-                self.remove_neighbor(update['neighbor_id'])
-                
-            elif update_type == 'UPDATE':
-                self.update_neighbor_status(
-                    neighbor_id=update['neighbor_id'],
-                    link_quality=update.get('link_quality'),
-                    signal_strength=update.get('signal_strength'),
-                    bandwidth_available=update.get('bandwidth_available')
-                )
+        if now is None:
+            now = self.clock.now()
+
+        for update in _drain_queue(self.neighbor_update_queue):
+            # Producers installing many links at once put one list per
+            # satellite instead of one queue entry per link
+            if isinstance(update, list):
+                for item in update:
+                    self._apply_neighbor_update(item, now)
+            else:
+                self._apply_neighbor_update(update, now)
+
+    def _apply_neighbor_update(self, update: dict, now: datetime):
+        """Apply one ADD/REMOVE/UPDATE entry from the neighbor queue"""
+        update_type = update.get('type', '')
+
+        if update_type == 'ADD':
+            self.add_neighbor(
+                neighbor_id=update['neighbor_id'],
+                start_time=update['start_time'],
+                end_time=update['end_time'],
+                link_quality=update.get('link_quality', 1),
+                now=now
+            )
+
+        elif update_type == 'REMOVE':
+            self.remove_neighbor(update['neighbor_id'])
+
+        elif update_type == 'UPDATE':
+            self.update_neighbor_status(
+                update['neighbor_id'],
+                now=now,
+                link_quality=update.get('link_quality'),
+                signal_strength=update.get('signal_strength'),
+                bandwidth_available=update.get('bandwidth_available')
+            )
     
-    def update_neighbor_status(self, neighbor_id: str, **kwargs):
+    def update_neighbor_status(self, neighbor_id: str, now: Optional[datetime] = None, **kwargs):
         """Update neighbor status information"""
-        with self.neighbor_lock:
+        if now is None:
+            now = self.clock.now()
+
+        with self._write_lock:
             if neighbor_id in self.neighbors:
                 neighbor = self.neighbors[neighbor_id]
                 for key, value in kwargs.items():
                     if value is not None and hasattr(neighbor, key):
                         setattr(neighbor, key, value)
-                neighbor.last_seen = datetime.now()
+                neighbor.last_seen = now
+                neighbor.last_seen_ts = now.timestamp()
                 neighbor.active = True
+                neighbor.recompute_cost()
+
+                idx = self._nid_to_idx[neighbor_id]
+                self._neighbor_quality[idx] = neighbor.link_quality
+                self._neighbor_active[idx] = 1
+                self._neighbor_view_dirty = True
     
-    def process_incoming_messages(self):
+    def process_incoming_messages(self, now: Optional[datetime] = None):
         """Process messages from other satellites"""
-        while not self.incoming_queue.empty():
-            message = self.incoming_queue.get()
-            
+        if now is None:
+            now = self.clock.now()
+
+        batch = _drain_queue(self.incoming_queue)
+        if not batch:
+            return
+
+        # Group the drained batch per sender, then start each sender's run
+        # at its newest full-table announcement: a full supersedes whatever
+        # came before it, but deltas are not cumulative -- each carries only
+        # the routes changed since the sender's previous broadcast -- so
+        # every delta after that full must be applied, oldest first.
+        # Skipping one would drop its changes for good, since the sequence
+        # watermark rejects anything older afterwards.
+        by_sender: Dict[str, List[RoutingMessage]] = {}
+        for message in batch:
             if isinstance(message, RoutingMessage):
-                self.process_routing_message(message)
+                by_sender.setdefault(message.sender_id, []).append(message)
+
+        for messages in by_sender.values():
+            # FIFO queues deliver per-sender messages in order already; the
+            # sort is a cheap guarantee of it on these small runs
+            messages.sort(key=lambda m: m.sequence_num)
+            start = 0
+            for i in range(len(messages) - 1, -1, -1):
+                if not messages[i].is_delta:
+                    start = i
+                    break
+            for message in messages[start:]:
+                self.process_routing_message(message, now)
                 self.stats['messages_processed'] += 1
-    
-    def process_routing_message(self, message: RoutingMessage):
+
+    def process_routing_message(self, message: RoutingMessage, now: Optional[datetime] = None):
         """Process a routing update message using distance vector algorithm"""
-        # Check for duplicate messages
-        message_key = (message.sender_id, message.sequence_num)
-        if message_key in self.seen_messages:
+        # Drop duplicates and stale retransmissions: anything at or below the
+        # highest sequence number already seen from this sender
+        if message.sequence_num <= self._last_seen_seq.get(message.sender_id, -1):
             return
+        self._last_seen_seq[message.sender_id] = message.sequence_num
+        current_time = now if now is not None else self.clock.now()
         
-        self.seen_messages.add(message_key)
-        current_time = self.clock.now()
-        
-        # First verify the sender is still our neighbor
-        with self.neighbor_lock:
-            if (message.sender_id not in self.neighbors or 
-                not self.neighbors[message.sender_id].active):
-                logging.debug(f"{self.id}: Ignoring message from non-neighbor {message.sender_id}")
-                return
-        
+        # First verify the sender is still our neighbor (lock-free snapshot)
+        sender_info = self.neighbors.get(message.sender_id)
+        if sender_info is None:
+            logging.debug("%s: Ignoring message from non-neighbor %s", self.id, message.sender_id)
+            return
+
+        # Hearing from the neighbor is proof of life; without this the
+        # inactivity sweep would flag every quiet-but-healthy link
+        now_ts = current_time.timestamp()
+        sender_info.last_seen = current_time
+        sender_info.last_seen_ts = now_ts
+        if not sender_info.active:
+            if not (sender_info.start_ts <= now_ts <= sender_info.end_ts):
+                return  # Outside the link window: stay inactive
+            with self._write_lock:
+                sender_info.active = True
+                idx = self._nid_to_idx.get(message.sender_id)
+                if idx is not None:
+                    self._neighbor_active[idx] = 1
+                self._neighbor_view_dirty = True
+            logging.info("%s: Neighbor %s is active again", self.id, message.sender_id)
+
         routes_updated = False
-        
-        with self.routing_lock:
+        current_ns = to_epoch_ns(current_time)
+
+        # Identical payload to the sender's previous one: the table pass
+        # cannot change anything, so just refresh the freshness timestamps
+        # of the routes this sender vouches for and return
+        if (message.routes_hash is not None
+                and self._last_routes_hash.get(message.sender_id) == message.routes_hash):
+            for route in self.routing_table.values():
+                if route.next_hop == message.sender_id:
+                    route.timestamp = current_ns
+            return
+        self._last_routes_hash[message.sender_id] = message.routes_hash
+
+        direct_cost = self.get_link_cost(message.sender_id)
+
+        with self._write_lock:
+            # Copy-on-write: apply the whole batch to one copy, swap once
+            table = dict(self.routing_table)
+
             # Update direct route to sender
-            direct_cost = self.get_link_cost(message.sender_id)
             if direct_cost != float('inf'):
-                self.routing_table[message.sender_id] = {
-                    'next_hop': message.sender_id,
-                    'hops': 1,
-                    'cost': direct_cost,
-                    'timestamp': current_time
-                }
+                existing = table.get(message.sender_id)
+                table[message.sender_id] = Route(
+                    next_hop=message.sender_id,
+                    hops=1,
+                    cost=direct_cost,
+                    timestamp=current_ns
+                )
                 routes_updated = True
-            
-            # Process routes from the message
-            for dest, route_info in message.routes.items():
-                if dest == self.id:  # Skip routes to self
+                # Only a real change makes the entry part of the next delta;
+                # a pure timestamp refresh is not worth broadcasting
+                if (existing is None or existing.cost != direct_cost
+                        or existing.next_hop != message.sender_id):
+                    self._dirty_routes.add(message.sender_id)
+
+            # Process routes from the message. Names used once per
+            # destination are hoisted out of the loop: this runs for every
+            # entry of every message, so repeated self./method lookups and
+            # the max-hop re-derivation are measurable at table scale.
+            my_id = self.id
+            sender_id = message.sender_id
+            max_hops = self.k_hops
+            table_get = table.get
+            mark_dirty = self._dirty_routes.add
+            for dest, (hops, cost) in message.routes.items():
+                if dest == my_id:  # Skip routes to self
                     continue
-                    
-                new_hops = route_info['hops'] + 1
-                if new_hops > self.k_hops:  # Skip if exceeds hop limit
+
+                new_hops = hops + 1
+                if new_hops > max_hops:  # Skip if exceeds hop limit
                     continue
-                
-                new_cost = route_info['cost'] + direct_cost
-                current_route = self.routing_table.get(dest)
-                
+
+                new_cost = cost + direct_cost
+                current_route = table_get(dest)
+
                 should_update = (
-                    not current_route or  # No existing route
-                    new_cost < current_route['cost'] or  # Better cost
-                    (message.sender_id == current_route['next_hop'] and  # Update from current next hop
-                     (new_cost != current_route['cost'] or 
-                      new_hops != current_route['hops']))
+                    current_route is None or  # No existing route
+                    new_cost < current_route.cost or  # Better cost
+                    (sender_id == current_route.next_hop and  # Update from current next hop
+                     (new_cost != current_route.cost or
+                      new_hops != current_route.hops))
                 )
-                
+
                 if should_update:
-                    self.routing_table[dest] = {
-                        'next_hop': message.sender_id,
-                        'hops': new_hops,
-                        'cost': new_cost,
-                        'timestamp': current_time
-                    }
+                    table[dest] = Route(
+                        next_hop=sender_id,
+                        hops=new_hops,
+                        cost=new_cost,
+                        timestamp=current_ns
+                    )
+                    mark_dirty(dest)
                     routes_updated = True
                     logging.info(
-                        f"{self.id}: Updated route to {dest} via {message.sender_id} "
-                        f"(hops: {new_hops}, cost: {new_cost})"
+                        "%s: Updated route to %s via %s (hops: %d, cost: %s)",
+                        my_id, dest, sender_id, new_hops, new_cost
                     )
+                elif current_route.next_hop == sender_id:
+                    # Unchanged route re-announced by its next hop: refresh
+                    # the timestamp so maintenance doesn't expire live routes
+                    current_route.timestamp = current_ns
+
+            if routes_updated:
+                self.routing_table = table
         
-        # Trigger update if routes changed
-        if routes_updated:
-            # Add small random delay to avoid synchronization
-            time.sleep(random.uniform(0.1, 0.3))
-            self.send_routing_update()
-    
-    def send_routing_update(self):
-        """Send routing updates to neighbors"""
-        current_time = self.clock.now()
-        
+        # Schedule a coalesced update instead of sleeping here: blocking the
+        # worker per message head-of-line-blocks the whole incoming queue.
+        # The small random jitter still avoids synchronized broadcasts.
+        if routes_updated and self._pending_since is None:
+            self._pending_since = current_time.timestamp() + _rng.uniform(0.1, 0.3)
+
+    def send_routing_update(self, now: Optional[datetime] = None, full: bool = False):
+        """Send routing updates to neighbors.
+
+        Sends a delta of routes changed since the last broadcast; a full
+        table goes out when `full` is set (new neighbor) or the periodic
+        full-sync interval elapses. With nothing dirty and no sync due,
+        nothing is sent at all.
+        """
+        current_time = now if now is not None else self.clock.now()
+        now_ts = current_time.timestamp()
+
+        if now_ts - self._last_full_sync >= self._full_sync_interval:
+            full = True
+
+        if not full and not self._dirty_routes:
+            return  # Steady state: nothing changed, nothing to say
+
         # Get active neighbors
-        print(self.neighbors.items())
-        print("DIVI 3")
-        with self.neighbor_lock:
-            print("DIVI 4")
-            active_neighbors = {
-                n_id: info for n_id, info in self.neighbors.items()
-                if info.active and info.start_time <= current_time <= info.end_time
-            }
-        
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("%s: neighbors before update: %s", self.id, list(self.neighbors))
+        active_neighbors = self.get_active_neighbors(current_time)
+
         if not active_neighbors:
             return  # No active neighbors to send updates to
-        
-        # Prepare routes while holding routing_lock
-        
-        with self.routing_lock:
-            routes = {
-                dest: {
-                    'hops': route['hops'],
-                    'cost': route['cost']
+
+        # Build the payload and consume the dirty set under the writer lock:
+        # callers like the harness invoke this from other threads, so an
+        # unlocked iterate-then-clear could both blow up mid-iteration and
+        # silently drop destinations dirtied between snapshot and clear. The
+        # lock also keeps the cached full payload paired with the exact
+        # table snapshot it was built from.
+        max_hops = self.k_hops
+        with self._write_lock:
+            table = self.routing_table
+            if full:
+                # Timestamp refreshes mutate routes in place and don't
+                # affect hops/cost, so identity of the table dict is exactly
+                # the condition under which the cached payload is still valid
+                if table is self._full_payload_table:
+                    routes = self._full_payload
+                    payload_hash = self._full_payload_hash
+                else:
+                    routes = {
+                        dest: (route.hops, route.cost)
+                        for dest, route in table.items()
+                        if route.hops < max_hops
+                    }
+                    payload_hash = hash(tuple(sorted(routes.items())))
+                    self._full_payload = routes
+                    self._full_payload_table = table
+                    self._full_payload_hash = payload_hash
+                self._last_full_sync = now_ts
+            else:
+                routes = {
+                    dest: (route.hops, route.cost)
+                    for dest in self._dirty_routes
+                    if (route := table.get(dest)) is not None
+                    and route.hops < max_hops
                 }
-                for dest, route in self.routing_table.items()
-                if route['hops'] < self.k_hops
-            }
-            
+                payload_hash = hash(tuple(sorted(routes.items())))
+            # Holding the lock, every dirty dest was either included above
+            # or points at a route that no longer exists/is unadvertisable,
+            # so clearing drops nothing a receiver could still want
+            self._dirty_routes.clear()
             self.sequence_num += 1
-            message = RoutingMessage(
-                sender_id=self.id,
-                sequence_num=self.sequence_num,
-                routes=routes,
-                timestamp=current_time
-            )
-        
+            sequence_num = self.sequence_num
+
+        message = RoutingMessage(
+            sender_id=self.id,
+            sequence_num=sequence_num,
+            routes=routes,
+            timestamp=current_time,
+            is_delta=not full,
+            routes_hash=payload_hash
+        )
+
         # Broadcast without holding any locks
         self.broadcast_to_neighbors(message)
         self.stats['routing_updates_sent'] += 1
     
     def get_link_cost(self, neighbor_id: str) -> float:
-        """Calculate cost of link to neighbor based only on hops"""
-
-        return 1
-        with self.neighbor_lock:
-            if neighbor_id in self.neighbors and self.neighbors[neighbor_id].active:
-                # Return constant cost of 1 for all active links
-
-                ## TODO: other factors
-                # neighbor = self.neighbors[neighbor_id]
-                
-                # # Combine multiple factors for link cost
-                # quality_factor = 1.0 / neighbor.link_quality
-                # signal_factor = abs(neighbor.signal_strength) / 100.0
-                # bandwidth_factor = 1.0 / (neighbor.bandwidth_available + 1)
-                
-                # # Weighted combination of factors
-                # cost = (0.5 * quality_factor + 
-                #        0.3 * signal_factor + 
-                #        0.2 * bandwidth_factor)
-                
-                # return max(1.0, cost)  # Minimum cost of 1.0
-                return 1.0
+        """Look up the cost of the link to a neighbor (lock-free read)"""
+        neighbor = self.neighbors.get(neighbor_id)
+        if neighbor is not None and neighbor.active:
+            # Cost is precomputed on NeighborInfo.recompute_cost whenever the
+            # link parameters change, so this is a single attribute load.
+            # With the default link_quality of 1 it stays the constant hop
+            # cost the routing tests expect.
+
+            ## TODO: other factors, to fold into recompute_cost
+            # signal_factor = abs(neighbor.signal_strength) / 100.0
+            # bandwidth_factor = 1.0 / (neighbor.bandwidth_available + 1)
+            # cost = (0.5 * neighbor.inv_quality +
+            #        0.3 * signal_factor +
+            #        0.2 * bandwidth_factor)
+            # return max(1.0, cost)  # Minimum cost of 1.0
+            return neighbor.cached_cost
         return float('inf')
     
     def broadcast_to_neighbors(self, message: Any):
         """Send message to all active neighbors"""
         current_time = self.clock.now()
-        print("DIVI 1")
         # Create a copy of active neighbors while holding the lock
-        with self.neighbor_lock:
-            print("DIVI 2")
-            active_neighbors = {
-                neighbor_id: neighbor 
-                for neighbor_id, neighbor in self.neighbors.items()
-                if (neighbor.active and 
-                    neighbor.start_time <= current_time <= neighbor.end_time)
-            }
-        
+        active_neighbors = self.get_active_neighbors(current_time)
+
         if not active_neighbors:
-            logging.debug(f"{self.id}: No active neighbors to broadcast to")
+            logging.debug("%s: No active neighbors to broadcast to", self.id)
             return
-        
-        logging.info(f"{self.id}: Broadcasting to active neighbors: {list(active_neighbors.keys())}")
-        
-        # Send messages without holding locks
-        for neighbor_id in active_neighbors:
-            neighbor = get_satellite_by_id(neighbor_id)
-            if neighbor:
-                try:
-                    neighbor.incoming_queue.put_nowait(message)  # Use non-blocking put
-                    logging.info(f"{self.id} -> {neighbor_id}: Sent routing update")
-                except Exception as e:
-                    logging.error(f"{self.id}: Failed to send to {neighbor_id}: {e}")
-            else:
-                logging.error(f"{self.id}: Failed to find neighbor {neighbor_id}")
+
+        logging.debug("%s: Broadcasting to active neighbors: %s", self.id, active_neighbors)
+
+        # Send without holding locks: one shared message instance into each
+        # cached queue reference (resolved when the active view was rebuilt)
+        for q in self._active_queues:
+            try:
+                q.put_nowait(message)  # Use non-blocking put
+            except Exception as e:
+                logging.error("%s: Failed to send routing update: %s", self.id, e)
     
     def print_routing_table(self, reason: str = ""):
         """Print current routing table with detailed information"""
-        with self.routing_lock:
-            logging.info(f"\n=== Routing Table for {self.id} ===")
-            if reason:
-                logging.info(f"Update reason: {reason}")
-            logging.info(f"Current time: {datetime.now()}")
-            logging.info(f"Number of routes: {len(self.routing_table)}")
-            
-            # Sort routes by hop count for better readability
-            sorted_routes = sorted(
-                self.routing_table.items(), 
-                key=lambda x: (x[1]['hops'], x[1]['cost'])
+        # The whole body is formatting; skip it entirely when nobody listens
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        # Lock-free snapshot: the table is swapped atomically, never mutated
+        table = self.routing_table
+        logging.info(f"\n=== Routing Table for {self.id} ===")
+        if reason:
+            logging.info(f"Update reason: {reason}")
+        logging.info(f"Current time: {datetime.now()}")
+        logging.info(f"Number of routes: {len(table)}")
+
+        # Sort routes by hop count for better readability
+        sorted_routes = sorted(
+            table.items(),
+            key=lambda x: (x[1].hops, x[1].cost)
+        )
+
+        now_ns = to_epoch_ns(datetime.now())
+        for dest, route in sorted_routes:
+            age = (now_ns - route.timestamp) // 1_000_000_000
+            logging.info(
+                f"To: {dest:8} | "
+                f"Via: {route.next_hop:8} | "
+                f"Hops: {route.hops:2} | "
+                f"Cost: {route.cost:6.2f} | "
+                f"Age: {age:3}s"
             )
-            
-            for dest, route in sorted_routes:
-                age = (datetime.now() - route['timestamp']).seconds
-                logging.info(
-                    f"To: {dest:8} | "
-                    f"Via: {route['next_hop']:8} | "
-                    f"Hops: {route['hops']:2} | "
-                    f"Cost: {route['cost']:6.2f} | "
-                    f"Age: {age:3}s"
-                )
-            logging.info("=" * 50)
+        logging.info("=" * 50)
 
     def process_ground_commands(self):
         """Process commands from ground station"""
         pass  # Ignoring ground commands for now
 
-    def cleanup_old_routes(self):
-        """Remove stale routing entries"""
-        current_time = self.clock.now()
-        max_age = timedelta(seconds=self.routing_update_interval * 3)
-        
-        with self.routing_lock:
-            routes_to_remove = []
-            for dest, route in self.routing_table.items():
-                age = current_time - route['timestamp']
-                if age > max_age:
-                    routes_to_remove.append(dest)
-            
-            for dest in routes_to_remove:
-                del self.routing_table[dest]
-                logging.info(f"{self.id}: Removed stale route to {dest}")
+    def cleanup_old_routes(self, now: Optional[datetime] = None):
+        """Remove stale routing entries.
+
+        Delegates to _periodic_maintenance so the staleness threshold stays
+        tied to the full-sync heartbeat: under the delta protocol a healthy
+        route's timestamp is only refreshed by full syncs, so ageing routes
+        against routing_update_interval would purge live tables.
+        """
+        current_time = now if now is not None else self.clock.now()
+        self._periodic_maintenance(current_time)
+
+class SatelliteScheduler:
+    """Single-threaded scheduler driving many satellites' tick() methods.
+
+    Thread-per-satellite costs one OS thread sleeping 100 ms per satellite;
+    at hundreds of satellites that is thousands of context switches per
+    second doing nothing. The scheduler keeps a min-heap of per-satellite
+    deadlines and each step only ticks the satellites that are actually due,
+    so one thread scales to thousands of satellites with no latency floor.
+    """
+
+    def __init__(self, satellites: List['SatelliteThread'], clock=None):
+        self.satellites = list(satellites)
+        self.clock = clock or (satellites[0].clock if satellites else datetime)
+        now_ts = self.clock.now().timestamp()
+        # (deadline_ts, satellite_id) heap; ids break ties deterministically
+        self._heap = [(now_ts, sat.id) for sat in self.satellites]
+        heapq.heapify(self._heap)
+        self._by_id = {sat.id: sat for sat in self.satellites}
+
+    def step(self) -> Optional[float]:
+        """Tick every satellite whose deadline has passed.
+
+        Returns the next pending deadline (epoch seconds), or None if idle.
+        """
+        now = self.clock.now()
+        now_ts = now.timestamp()
+        while self._heap and self._heap[0][0] <= now_ts:
+            _, sat_id = heapq.heappop(self._heap)
+            sat = self._by_id[sat_id]
+            sat.tick(now)
+            heapq.heappush(self._heap, (sat.next_deadline(now_ts), sat_id))
+
+        # Ticking one satellite enqueues messages on others whose heap
+        # deadlines were computed before the send; pull those forward so a
+        # message chain is delivered within the same step
+        while True:
+            pending = [sat for sat in self.satellites
+                       if not sat.incoming_queue.empty()
+                       or not sat.neighbor_update_queue.empty()]
+            if not pending:
+                break
+            for sat in pending:
+                sat.tick(now)
+            self._heap = [(sat.next_deadline(now_ts), sat.id) for sat in self.satellites]
+            heapq.heapify(self._heap)
+
+        return self._heap[0][0] if self._heap else None
+
+    def run_for(self, duration: timedelta, tick_interval: float = 0.1):
+        """Drive the network for a wall/simulated duration."""
+        end_time = self.clock.now() + duration
+        while self.clock.now() < end_time:
+            self.step()
+            time.sleep(tick_interval)
@@ -1,48 +1,118 @@
 from typing import List, Tuple
+from array import array
 import heapq
 
 class Satellite:
-    def __init__(self, x: int, y: int, satellite_type: str, direction: str, compute_capacity: int):
-        self.x = x
-        self.y = y
-        self.satellite_type = satellite_type
-        self.direction = direction
-        self.compute_capacity = compute_capacity
+    """Lightweight view over one row of the network's column arrays"""
+    __slots__ = ('_network', '_index')
 
-class SatelliteNetwork:
-    def __init__(self):
-        self.satellites = {}
+    def __init__(self, network: 'SatelliteNetwork', index: int):
+        self._network = network
+        self._index = index
+
+    @property
+    def x(self) -> int:
+        return self._network._x[self._index]
+
+    @property
+    def y(self) -> int:
+        return self._network._y[self._index]
 
-    def add_satellite(self, satellite: Satellite):
-        self.satellites[(satellite.x, satellite.y)] = satellite
+    @property
+    def satellite_type(self) -> str:
+        return self._network._satellite_type[self._index]
 
-    def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
-        neighbors = []
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            new_x, new_y = x + dx, y + dy
-            if (new_x, new_y) in self.satellites:
-                neighbors.append((new_x, new_y))
-        return neighbors
+    @property
+    def direction(self) -> str:
+        return self._network._direction[self._index]
+
+    @property
+    def compute_capacity(self) -> int:
+        return self._network._compute_capacity[self._index]
+
+class SatelliteNetwork:
+    def __init__(self):
+        # Struct-of-arrays layout: one compact column per field instead of a
+        # Python object (and its __dict__) per satellite. Coordinates map to
+        # row indices through _coord_to_idx.
+        self._x = array('i')
+        self._y = array('i')
+        self._compute_capacity = array('i')
+        self._satellite_type: List[str] = []
+        self._direction: List[str] = []
+        self._coord_to_idx = {}
+        # Precomputed adjacency: coord -> ((neighbor, weight), ...). Built
+        # lazily on first search and invalidated when the grid changes, so the
+        # search loops do no membership probes at all.
+        self._adjacency = None
+
+    def add_satellite(self, x: int, y: int, satellite_type: str, direction: str, compute_capacity: int):
+        self._coord_to_idx[(x, y)] = len(self._x)
+        self._x.append(x)
+        self._y.append(y)
+        self._compute_capacity.append(compute_capacity)
+        self._satellite_type.append(satellite_type)
+        self._direction.append(direction)
+        self._adjacency = None  # Grid changed; rebuild on next search
+
+    def get_satellite(self, x: int, y: int) -> Satellite:
+        return Satellite(self, self._coord_to_idx[(x, y)])
+
+    # Moves along x stay in the same orbit (cost 1); moves along y cross
+    # orbits (cost 2). Encoding the weight with the offset removes the
+    # same-orbit branch from the search loops.
+    _NEIGHBOR_OFFSETS = ((1, 0, 1), (-1, 0, 1), (0, 1, 2), (0, -1, 2))
+
+    def get_neighbors(self, x: int, y: int) -> List[Tuple[Tuple[int, int], int]]:
+        if self._adjacency is None:
+            self._build_adjacency()
+        return self._adjacency.get((x, y), [])
+
+    def _build_adjacency(self):
+        adjacency = {}
+        for coord in self._coord_to_idx:
+            x, y = coord
+            neighbors = []
+            for dx, dy, weight in self._NEIGHBOR_OFFSETS:
+                new_x, new_y = x + dx, y + dy
+                if (new_x, new_y) in self._coord_to_idx:
+                    neighbors.append(((new_x, new_y), weight))
+            adjacency[coord] = neighbors
+        self._adjacency = adjacency
+
+    def _heuristic(self, node: Tuple[int, int], target: Tuple[int, int]) -> int:
+        # Manhattan distance; admissible since the cheapest edge costs 1
+        return abs(node[0] - target[0]) + abs(node[1] - target[1])
 
     def shortest_path(self, source: Tuple[int, int], target: Tuple[int, int]) -> List[Tuple[int, int]]:
-        queue = [(0, source, [])]
-        visited = set()
+        # A* on the 4-connected grid. Parents are tracked in came_from and the
+        # path is rebuilt once at the goal, instead of copying the partial path
+        # on every heap push.
+        queue = [(self._heuristic(source, target), 0, source)]
+        came_from = {source: None}
+        g_score = {source: 0}
 
         while queue:
-            (cost, current, path) = heapq.heappop(queue)
+            (_, cost, current) = heapq.heappop(queue)
 
             if current == target:
-                return path + [current]
-
-            if current in visited:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+
+            # Stale heap entry: a cheaper path to this node was already found
+            if cost > g_score[current]:
                 continue
 
-            visited.add(current)
-
-            for neighbor in self.get_neighbors(*current):
-                if neighbor not in visited:
-                    new_cost = cost + (1 if current[1] == neighbor[1] else 2)  # Intra-orbital: 1, Inter-orbital: 2
-                    heapq.heappush(queue, (new_cost, neighbor, path + [current]))
+            for neighbor, weight in self.get_neighbors(*current):
+                new_cost = cost + weight
+                if neighbor not in g_score or new_cost < g_score[neighbor]:
+                    g_score[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(queue, (new_cost + self._heuristic(neighbor, target), new_cost, neighbor))
 
         return []  # No path found
 
@@ -58,12 +128,12 @@ class SatelliteNetwork:
 
             visited.add(current)
 
-            if self.satellites[current].satellite_type == "CS":
+            if self._satellite_type[self._coord_to_idx[current]] == "CS":
                 return current
 
-            for neighbor in self.get_neighbors(*current):
+            for neighbor, weight in self.get_neighbors(*current):
                 if neighbor not in visited:
-                    new_cost = cost + (1 if current[1] == neighbor[1] else 2)  # Intra-orbital: 1, Inter-orbital: 2
+                    new_cost = cost + weight
                     heapq.heappush(queue, (new_cost, neighbor))
 
         return None  # No Compute Satellite found
@@ -77,8 +147,7 @@ def read_input_file(filename: str) -> Tuple[SatelliteNetwork, List[Tuple[int, in
         
         for _ in range(num_satellites):
             x, y, sat_type, direction, capacity = f.readline().strip().split()
-            satellite = Satellite(int(x), int(y), sat_type, direction, int(capacity))
-            network.add_satellite(satellite)
+            network.add_satellite(int(x), int(y), sat_type, direction, int(capacity))
         
         num_queries = int(f.readline().strip())
         for _ in range(num_queries):